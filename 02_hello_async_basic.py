@@ -46,6 +46,11 @@ Objects that can be used with await must be awaitable:
 import asyncio
 import time
 
+try:
+    import uvloop  # Optional: libuv-based event loop written in C
+except ImportError:
+    uvloop = None
+
 async def say_hello_async():
     """
     Asynchronous version using await
@@ -62,7 +67,9 @@ async def say_hello_async():
 if __name__ == "__main__":
     print("=== Basic Asynchronous Hello World ===")
     start_time = time.time()
-    # asyncio.run() creates event loop, runs coroutine, and cleans up
-    asyncio.run(say_hello_async())
+    # asyncio.run() creates event loop, runs coroutine, and cleans up.
+    # If uvloop is installed, its faster C event loop is used instead.
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    asyncio.run(say_hello_async(), loop_factory=loop_factory)
     end_time = time.time()
     print(f"Total time: {end_time - start_time:.2f} seconds") 
\ No newline at end of file
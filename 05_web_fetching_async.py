@@ -14,7 +14,9 @@ aiohttp and asyncio for concurrent HTTP requests instead of sequential ones.
 KEY CONCEPTS DEMONSTRATED:
 - aiohttp.ClientSession: Async HTTP client with connection pooling
 - async with: Proper resource management for async operations
-- asyncio.gather(*tasks): Concurrent execution of multiple HTTP requests
+- asyncio.wait(FIRST_COMPLETED): Concurrent execution of multiple HTTP requests,
+  handling each response as soon as it arrives
+- Bounding the number of tasks in flight
 - Massive performance improvements for I/O-bound operations
 
 THE POWER OF ASYNC WEB REQUESTS:
@@ -58,14 +60,77 @@ SCALABILITY BENEFITS:
 - No need for complex thread synchronization
 - Better resource utilization
 
+MANY REQUESTS TO ONE HOST:
+aiohttp speaks HTTP/1.1, so concurrent requests to the same host each need 
+their own pooled connection (limit_per_host caps how many). When a workload 
+hits one HTTPS host many times, an HTTP/2 client such as 
+httpx.AsyncClient(http2=True) can multiplex all requests over a single 
+connection instead. HTTP/2 is negotiated during the TLS handshake, so it 
+brings nothing for the plain http:// URLs used here.
+
 The dramatic performance difference makes this a must-use pattern 
 for any I/O-bound Python application.
 """
 
 import aiohttp
 import asyncio
+import sys
 import time
 
+try:
+    import uvloop  # Optional: libuv-based event loop written in C
+except ImportError:
+    uvloop = None
+
+# URLs fetched by the demo (a tuple constant, built once at import)
+URLS = (
+    'http://example.com',
+    'http://example.org',
+    'http://httpbin.org/get',
+)
+
+# Progress messages from concurrent tasks. They are collected here and
+# printed in one write by flush_log(), so tasks never contend for stdout.
+_log = []
+
+def flush_log():
+    """Print all collected progress messages with a single write"""
+    if _log:
+        sys.stdout.write("\n".join(_log) + "\n")
+        _log.clear()
+
+# Shared session, created lazily by get_session() and reused across calls
+_session = None
+
+def get_session():
+    """
+    Return the shared aiohttp.ClientSession, creating it on first use
+    
+    Building a session sets up a connection pool, DNS cache and SSL
+    context, so it is done once and reused instead of per batch of URLs.
+    Must be called while the event loop is running.
+    """
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,            # Total open connections
+                limit_per_host=32,    # Open connections per host
+                ttl_dns_cache=300,    # Cache DNS lookups for 5 minutes
+                keepalive_timeout=30, # Keep idle connections for reuse
+            ),
+            # Built once here instead of per request
+            timeout=aiohttp.ClientTimeout(total=10, sock_connect=2, sock_read=5),
+        )
+    return _session
+
+async def close_session():
+    """Close the shared session (call once, before the event loop shuts down)"""
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
 async def fetch_async(url, session):
     """
     Asynchronously fetch a URL using aiohttp
@@ -73,60 +138,89 @@ async def fetch_async(url, session):
     This coroutine demonstrates:
     1. Non-blocking HTTP request
     2. Proper async resource management with 'async with'
-    3. Concurrent execution capability
+    3. Streaming the body in chunks instead of buffering it whole
     4. Exception handling in async context
+    
+    Returns a (url, size_in_bytes) tuple; size is None if the fetch failed.
     """
-    print(f"Starting to fetch: {url}")
+    _log.append(f"Starting to fetch: {url}")
     try:
         # async with ensures proper connection cleanup
-        async with session.get(url, timeout=10) as response:
-            content = await response.text()
-            print(f"Completed fetch: {url} - Status: {response.status}")
-            return content
+        async with session.get(url) as response:
+            # Only the size is needed, so count each chunk and let it go
+            size = 0
+            async for chunk in response.content.iter_chunked(65536):
+                size += len(chunk)
+            _log.append(f"Completed fetch: {url} - Status: {response.status}")
+            return url, size
     except Exception as e:
-        print(f"Error fetching {url}: {e}")
-        return None
+        _log.append(f"Error fetching {url}: {e}")
+        return url, None
 
-async def main():
+async def main(concurrency=10):
     """
     Main async function demonstrating concurrent HTTP requests
     
     Pattern used:
-    1. Create aiohttp.ClientSession for connection pooling
-    2. Create list of tasks for all URLs
-    3. Use asyncio.gather() to run all requests concurrently
-    4. Process results after all complete
+    1. Reuse the shared aiohttp.ClientSession for connection pooling
+    2. Create a task for each URL as soon as a slot is free
+    3. Use asyncio.wait() to run up to `concurrency` requests concurrently
+    4. Process each result as soon as its request finishes
     
     Key insight: All requests start immediately, run in parallel,
     and complete in approximately the time of the slowest request.
-    """
-    urls = [
-        'http://example.com',
-        'http://example.org',
-        'http://httpbin.org/get'
-    ]
     
+    A new task is only created when one of the `concurrency` slots frees
+    up, so no more than `concurrency` Task objects exist at any time and
+    the same code stays well-behaved with thousands of URLs.
+    """
+    # With eager tasks each request starts as soon as its task is created.
+    # uvloop 0.23 can't create eager tasks, so this is stock-loop only.
+    if uvloop is None:
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
     print("=== Asynchronous Web Fetching ===")
     start_time = time.time()
     
-    # async with ensures session is properly closed
-    async with aiohttp.ClientSession() as session:
-        # Create tasks for all URLs - they start immediately
-        tasks = [fetch_async(url, session) for url in urls]
-        
-        # Run all tasks concurrently - this is where the magic happens!
-        results = await asyncio.gather(*tasks)
+    # The session outlives main() so its pooled connections can be reused
+    session = get_session()
+    
+    results = []
+    
+    def collect(done):
+        for task in done:
+            url, size = task.result()
+            if size is not None:
+                results.append(f"Fetched {size} bytes from {url}")
+    
+    # Run the requests concurrently - this is where the magic happens!
+    # asyncio.wait() hands back each finished task as soon as it is ready
+    pending = set()
+    for url in URLS:
+        if len(pending) >= concurrency:
+            # Wait for a free slot before creating the next task
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            collect(done)
+        pending.add(asyncio.create_task(fetch_async(url, session)))
+    
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        collect(done)
     
     end_time = time.time()
     
+    flush_log()
     print(f"\nResults:")
-    for i, result in enumerate(results):
-        if result:
-            print(f"  - Fetched {len(result)} characters from {urls[i]}")
+    for result in results:
+        print(f"  - {result}")
     
     print(f"\nDone in {end_time - start_time:.2f} seconds")
     print("Notice: Much faster than synchronous version!")
     print("All requests ran concurrently, not sequentially!")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # Use uvloop's C event loop when available, the stock asyncio loop otherwise
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
+        # Close the shared session on the same loop that created it
+        runner.run(close_session()) 
\ No newline at end of file
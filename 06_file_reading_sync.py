@@ -72,8 +72,12 @@ def create_sample_files():
     }
     
     for filename, content in files_data.items():
-        with open(filename, 'w') as f:
-            f.write(content)
+        # os.open/os.write skip the buffered file object: one write syscall per file
+        fd = os.open(filename, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, content.encode('utf-8'))
+        finally:
+            os.close(fd)
     
     return list(files_data.keys())
 
@@ -87,11 +91,24 @@ def read_file_sync(filepath):
     3. Close file handle
     
     During step 2, the program waits for disk I/O to complete.
+    The file size is known up front, so the bytes are read straight into a
+    preallocated buffer and decoded once, with no intermediate bytes object.
     """
     print(f"Starting to read: {filepath}")
     try:
-        with open(filepath, 'r') as file:
-            content = file.read()  # Blocking I/O operation
+        with open(filepath, 'rb', buffering=0) as file:
+            size = os.fstat(file.fileno()).st_size
+            buffer = bytearray(size)
+            view = memoryview(buffer)
+            read = 0
+            while read < size:
+                n = file.readinto(view[read:])  # Blocking I/O operation
+                if not n:
+                    break  # File shrank while reading
+                read += n
+            view.release()
+        del buffer[read:]
+        content = buffer.decode('utf-8')
         print(f"Completed reading: {filepath}")
         return content
     except Exception as e:
@@ -137,10 +154,15 @@ def main():
     
     end_time = time.time()
     
-    print(f"\nResults:")
-    for filepath, content in results:
-        print(f"  - {filepath}: {len(content)} characters")
-        print(f"    Preview: {content[:50]}...")
+    # Build the whole report first and print it once, instead of two
+    # print() calls per file
+    report = "\n".join(
+        f"  - {filepath}: {len(content)} characters\n    Preview: {content[:50]}..."
+        for filepath, content in results
+    )
+    total_chars = sum(len(content) for _, content in results)
+    print(f"\nResults:\n{report}")
+    print(f"Total: {total_chars} characters in {len(results)} files")
     
     print(f"\nDone in {end_time - start_time:.4f} seconds")
     print("Notice: Each file was read completely before starting the next")
@@ -26,7 +26,8 @@ HOW RUN_IN_EXECUTOR WORKS:
 1. The Asynchronous Wrapper (async_wrapper function):
    - This async function demonstrates how to run the synchronous sync_task in a way 
      that does not block the event loop
-   - It achieves this by utilizing loop.run_in_executor(None, sync_task)
+   - It achieves this by utilizing asyncio.to_thread(sync_task, ...), the shorthand for 
+     loop.run_in_executor(None, sync_task, ...) that looks up the running loop itself
    - loop.run_in_executor(None, sync_task) schedules sync_task to run in a separate 
      thread or process, depending on the executor used
    - The default executor (None specified as the first argument) runs tasks in a thread pool
@@ -36,13 +37,14 @@ HOW RUN_IN_EXECUTOR WORKS:
 2. Executing Asynchronously (main function):
    - The main async function showcases how to run both synchronous and asynchronous 
      tasks together without blocking
-   - asyncio.gather is used to schedule concurrent execution of the async_wrapper and 
-     potentially other asynchronous tasks
-   - By using gather, you ensure that the event loop can manage multiple tasks, running 
-     them concurrently where possible
+   - asyncio.TaskGroup is used to schedule concurrent execution of the async_wrapper 
+     and potentially other asynchronous tasks
+   - By using a TaskGroup, you ensure that the event loop can manage multiple tasks, 
+     running them concurrently where possible, and that all of them have finished 
+     when the async with block exits
 
-3. Starting the Event Loop (asyncio.run(main())):
-   - Finally, asyncio.run(main()) is called to run the main coroutine, which effectively 
+3. Starting the Event Loop (asyncio.Runner):
+   - Finally, runner.run(main()) is called to run the main coroutine, which effectively 
      starts the event loop and executes the tasks scheduled within main
 
 WHY IS THIS APPROACH NEEDED?
@@ -65,10 +67,45 @@ EXECUTOR TYPES:
 - ThreadPoolExecutor: Good for I/O-bound synchronous tasks
 - ProcessPoolExecutor: Better for CPU-bound tasks (bypasses GIL)
 - None (default): Uses the default ThreadPoolExecutor
+
+SHARED EXECUTORS:
+Creating a pool starts threads or processes, which is expensive. This example 
+creates one thread pool and one process pool at import time, installs the 
+thread pool as the loop's default executor, and reuses both for every call.
 """
 
 import asyncio
+import atexit
+import math
+import os
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    import uvloop  # Optional: libuv-based event loop written in C
+except ImportError:
+    uvloop = None
+
+# Shared executors, created once and reused by every wrapper below.
+# The thread pool is sized for blocking I/O (override with THREAD_POOL_SIZE);
+# the process pool (see _ensure_cpu_pool) gets one worker per CPU core.
+_IO_POOL = ThreadPoolExecutor(max_workers=int(os.environ.get("THREAD_POOL_SIZE", 16)))
+atexit.register(_IO_POOL.shutdown)
+_CPU_POOL = None
+
+def _ensure_cpu_pool():
+    """
+    Return the shared ProcessPoolExecutor, creating it on first use
+    
+    The pool is created lazily rather than at import time: with the
+    "spawn" start method (Windows, macOS) every worker process re-imports
+    this module and must not set up a pool of its own.
+    """
+    global _CPU_POOL
+    if _CPU_POOL is None:
+        _CPU_POOL = ProcessPoolExecutor()
+        atexit.register(_CPU_POOL.shutdown)
+    return _CPU_POOL
 
 def sync_task(name, duration):
     """
@@ -88,9 +125,13 @@ def cpu_intensive_task(n):
     
     This type of task benefits from ProcessPoolExecutor
     to bypass Python's GIL limitations.
+    
+    math.sumprod() runs the multiply-and-add loop in C (with exact integer
+    results), so the work stays O(n) without a Python-level generator.
     """
     print(f"Starting CPU-intensive task with n={n}")
-    result = sum(i * i for i in range(n))
+    numbers = range(n)
+    result = math.sumprod(numbers, numbers)
     print(f"CPU-intensive task completed: sum of squares up to {n}")
     return result
 
@@ -99,14 +140,11 @@ async def async_wrapper(name, duration):
     Async wrapper that runs sync tasks without blocking the event loop
     
     This demonstrates the key pattern:
-    1. Get the running event loop
-    2. Use run_in_executor to run sync code in a thread
-    3. await the result without blocking other async tasks
+    1. Use asyncio.to_thread to run sync code in the default thread pool
+       (equivalent to loop.run_in_executor(None, ...) on the running loop)
+    2. await the result without blocking other async tasks
     """
-    loop = asyncio.get_running_loop()
-    # Run the synchronous task in a thread pool
-    result = await loop.run_in_executor(None, sync_task, name, duration)
-    return result
+    return await asyncio.to_thread(sync_task, name, duration)
 
 async def async_task(name, duration):
     """
@@ -124,11 +162,12 @@ async def cpu_wrapper(n):
     """
     Async wrapper for CPU-intensive tasks
     
-    For CPU-bound work, consider using ProcessPoolExecutor
+    CPU-bound work runs in the shared ProcessPoolExecutor
     instead of the default ThreadPoolExecutor.
     """
     loop = asyncio.get_running_loop()
-    result = await loop.run_in_executor(None, cpu_intensive_task, n)
+    # Processes sidestep the GIL, so the computation doesn't stall the threads
+    result = await loop.run_in_executor(_ensure_cpu_pool(), cpu_intensive_task, n)
     return result
 
 async def main():
@@ -137,31 +176,53 @@ async def main():
     
     Shows how to mix sync and async tasks:
     1. Wrap sync tasks with run_in_executor
-    2. Use asyncio.gather to run everything concurrently
+    2. Use asyncio.TaskGroup to run everything concurrently
     3. Both sync and async tasks complete efficiently
+    
+    If a task fails, the TaskGroup cancels the others and raises an
+    ExceptionGroup with every failure, which except* unpacks.
     """
     print("=== Mixing Async and Sync: Hybrid Approach ===")
     
+    # Eager tasks run up to their first await as soon as they are created.
+    # Stock loop only: uvloop 0.23 rejects the factory's eager_start argument.
+    if uvloop is None:
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
+    # run_in_executor(None, ...) now uses our right-sized shared thread pool
+    asyncio.get_running_loop().set_default_executor(_IO_POOL)
+    
     start_time = time.time()
     
     # Mix async and sync tasks running concurrently
-    results = await asyncio.gather(
-        async_wrapper("Sync-1", 2),        # Sync task wrapped in async
-        async_task("Async-1", 1),          # Pure async task
-        async_wrapper("Sync-2", 3),        # Another sync task wrapped
-        async_task("Async-2", 1.5),        # Another pure async task
-        cpu_wrapper(100000),               # CPU-intensive task
-        return_exceptions=True
-    )
+    jobs = [
+        (async_wrapper, ("Sync-1", 2)),    # Sync task wrapped in async
+        (async_task, ("Async-1", 1)),      # Pure async task
+        (async_wrapper, ("Sync-2", 3)),    # Another sync task wrapped
+        (async_task, ("Async-2", 1.5)),    # Another pure async task
+        (cpu_wrapper, (100000,)),          # CPU-intensive task
+    ]
+    tasks = []
+    errors = []
+    try:
+        async with asyncio.TaskGroup() as tg:
+            # Each coroutine is created only when it can be scheduled: an eager
+            # task that fails at once shuts the group down, and coroutines made
+            # in advance would then never be awaited
+            for func, args in jobs:
+                tasks.append(tg.create_task(func(*args)))
+    except* Exception as eg:
+        errors = eg.exceptions
     
     end_time = time.time()
     
     print(f"\nResults:")
-    for i, result in enumerate(results):
-        if isinstance(result, Exception):
-            print(f"  Task {i+1}: Error - {result}")
-        else:
-            print(f"  Task {i+1}: {result}")
+    for i, task in enumerate(tasks):
+        # Failed and cancelled tasks have no result to show
+        if not task.cancelled() and task.exception() is None:
+            print(f"  Task {i+1}: {task.result()}")
+    for error in errors:
+        print(f"  Error - {error}")
     
     print(f"\nTotal time: {end_time - start_time:.2f} seconds")
     print("Notice: Sync tasks ran in thread pool without blocking async tasks!")
@@ -175,33 +236,36 @@ async def demonstrate_executor_types():
     """
     print("\n=== Different Executor Types ===")
     
-    import concurrent.futures
-    
     loop = asyncio.get_running_loop()
     
-    # Using ThreadPoolExecutor (default) - good for I/O-bound tasks
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as thread_executor:
-        thread_result = await loop.run_in_executor(
-            thread_executor, 
-            sync_task, 
-            "Thread", 
-            1
-        )
-        print(f"Thread executor result: {thread_result}")
-    
-    # Using ProcessPoolExecutor for CPU-bound tasks - bypasses GIL
-    with concurrent.futures.ProcessPoolExecutor(max_workers=2) as process_executor:
-        process_result = await loop.run_in_executor(
-            process_executor, 
-            cpu_intensive_task, 
-            500000
-        )
-        print(f"Process executor result: {process_result}")
+    # Using ThreadPoolExecutor - good for I/O-bound tasks.
+    # The shared pool outlives this call, so no threads are started or joined here.
+    thread_result = await loop.run_in_executor(
+        _IO_POOL, 
+        sync_task, 
+        "Thread", 
+        1
+    )
+    print(f"Thread executor result: {thread_result}")
+    
+    # Using ProcessPoolExecutor for CPU-bound tasks - bypasses GIL.
+    # The shared pool is reused, so its worker processes are already running.
+    process_result = await loop.run_in_executor(
+        _ensure_cpu_pool(), 
+        cpu_intensive_task, 
+        500000
+    )
+    print(f"Process executor result: {process_result}")
 
 if __name__ == "__main__":
-    asyncio.run(main())
-    
-    print("\nPress Enter to see different executor types demonstration...")
-    input()
-    
-    asyncio.run(demonstrate_executor_types()) 
\ No newline at end of file
+    # One Runner for both demos: the default executor is only shut down
+    # when the Runner closes, so the shared pool survives between them.
+    # uvloop's event loop is used when it is installed.
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        runner.run(main())
+        
+        print("\nPress Enter to see different executor types demonstration...")
+        input()
+        
+        runner.run(demonstrate_executor_types()) 
\ No newline at end of file
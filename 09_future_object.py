@@ -57,8 +57,9 @@ HOW IT WORKS:
   as its callback using add_done_callback. The async_operation is then awaited with 
   the Future and sample data ("success" or any other value to simulate failure).
 
-• After async_operation completed, main check if the Future is done using done(). 
-  It then attempts to print the result directly, handling any potential exceptions.
+• Once async_operation has returned, the Future is guaranteed to be done, so main 
+  simply awaits it. Awaiting a done Future returns its result or re-raises its 
+  exception, which main handles.
 
 This example succinctly demonstrates the basic mechanisms of managing asynchronous 
 operations with Futures in Python's asyncio, including setting results, handling 
@@ -74,6 +75,21 @@ PRACTICAL APPLICATIONS:
 import asyncio
 import random
 
+try:
+    import uvloop  # Optional: libuv-based event loop written in C
+except ImportError:
+    uvloop = None
+
+# How async_operation completes the Future for each known data value;
+# any other value becomes a normal result that echoes the data
+_ACTIONS = {
+    "success": lambda future, data: future.set_result("Operation succeeded"),
+    "error": lambda future, data: future.set_exception(RuntimeError("Operation failed")),
+}
+
+def _complete_with_data(future, data):
+    future.set_result(f"Operation completed with data: {data}")
+
 # A function to simulate an asynchronous operation using a Future
 async def async_operation(future, data, delay=3):
     """
@@ -87,12 +103,18 @@ async def async_operation(future, data, delay=3):
     await asyncio.sleep(delay)  # Simulate some async work with a delay
     
     # Set the result or exception based on the input data
-    if data == "success":
-        future.set_result("Operation succeeded")
-    elif data == "error":
-        future.set_exception(RuntimeError("Operation failed"))
-    else:
-        future.set_result(f"Operation completed with data: {data}")
+    _ACTIONS.get(data, _complete_with_data)(future, data)
+
+# The same operation written as a plain coroutine that returns its result
+async def async_operation_returning_value(data, delay=3):
+    """
+    Simulate an async operation that returns its result directly
+    
+    Wrapped in a Task (itself a Future subclass), this needs no separate
+    Future: the Task completes with whatever the coroutine returns.
+    """
+    await asyncio.sleep(delay)  # Simulate some async work with a delay
+    return f"Operation completed with data: {data}"
 
 # A callback function to be called when the Future is done
 def future_callback(future):
@@ -118,12 +140,12 @@ async def basic_future_example():
     1. Create a Future object
     2. Add callbacks for when it completes
     3. Start async operation that will set the result
-    4. Check the result when done
+    4. Await the Future to get the result (or its exception)
     """
     print("=== Basic Future Example ===")
     
-    # Create a Future object
-    future = asyncio.Future()
+    # Create a Future object attached to the running loop
+    future = asyncio.get_running_loop().create_future()
     
     # Add a callback to the Future
     future.add_done_callback(future_callback)
@@ -132,13 +154,11 @@ async def basic_future_example():
     print("Starting async operation...")
     await async_operation(future, "success")  # Try changing "success" to "error"
     
-    # Check if the Future is done and print its result
-    if future.done():
-        try:
-            result = future.result()
-            print(f"Main thread - Result: {result}")
-        except Exception as exc:
-            print(f"Main thread - Exception: {exc}")
+    # async_operation has set the Future, so awaiting it returns at once
+    try:
+        print(f"Main thread - Result: {await future}")
+    except Exception as exc:
+        print(f"Main thread - Exception: {exc}")
 
 async def multiple_futures_example():
     """
@@ -149,8 +169,7 @@ async def multiple_futures_example():
     """
     print("\n=== Multiple Futures Example ===")
     
-    # Create multiple futures
-    futures = []
+    loop = asyncio.get_running_loop()
     operations = [
         ("success", 2),
         ("custom_data", 4), 
@@ -158,23 +177,30 @@ async def multiple_futures_example():
         ("another_success", 7)
     ]
     
-    for i, (data, delay) in enumerate(operations):
-        future = asyncio.Future()
-        future.add_done_callback(lambda f, idx=i: print(f"Future {idx} callback executed"))
-        futures.append(future)
-        
-        # Start async operation (don't await yet)
+    def make_callback(idx):
+        return lambda f: print(f"Future {idx} callback executed")
+    
+    # Create multiple futures straight from the running loop
+    futures = [loop.create_future() for _ in operations]
+    for i, future in enumerate(futures):
+        future.add_done_callback(make_callback(i))
+    
+    # Start async operations (don't await yet). Keeping references to the
+    # tasks stops them from being garbage collected while they run.
+    tasks = [
         asyncio.create_task(async_operation(future, data, delay))
+        for future, (data, delay) in zip(futures, operations)
+    ]
     
     print("All operations started...")
     
-    # Wait for all futures to complete
-    for i, future in enumerate(futures):
-        try:
-            result = await future
+    # Wait for all futures together; failures come back as exception objects
+    results = await asyncio.gather(*futures, return_exceptions=True)
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            print(f"Future {i} failed: {result}")
+        else:
             print(f"Future {i}: {result}")
-        except Exception as e:
-            print(f"Future {i} failed: {e}")
 
 async def future_with_timeout_example():
     """
@@ -182,21 +208,22 @@ async def future_with_timeout_example():
     
     Demonstrates how to handle slow operations
     by setting timeouts on Future objects.
+    
+    A Task is a Future, so wait_for() can wait on it directly. When the
+    timeout expires, wait_for() cancels the task for us.
     """
     print("\n=== Future with Timeout Example ===")
     
-    future = asyncio.Future()
-    
     # Start a slow operation
-    slow_task = asyncio.create_task(async_operation(future, "slow_result", 6))
+    slow_task = asyncio.create_task(async_operation_returning_value("slow_result", 6))
     
     try:
-        # Wait for the future with a timeout
-        result = await asyncio.wait_for(future, timeout=3.0)
+        # Wait for the task with a timeout
+        result = await asyncio.wait_for(slow_task, timeout=3.0)
         print(f"Result: {result}")
     except asyncio.TimeoutError:
         print("Operation timed out!")
-        slow_task.cancel()  # Cancel the slow task
+        print(f"Task cancelled: {slow_task.cancelled()}")
 
 async def future_state_monitoring():
     """
@@ -204,6 +231,10 @@ async def future_state_monitoring():
     
     Shows how to check Future state and monitor
     its progress until completion.
+    
+    Instead of polling done() in a loop, the Future notifies us itself:
+    a done callback reports the state change and a single await waits
+    for the result.
     """
     print("\n=== Future State Monitoring ===")
     
@@ -212,13 +243,14 @@ async def future_state_monitoring():
     print(f"Future done: {future.done()}")
     print(f"Future cancelled: {future.cancelled()}")
     
+    # Get notified when the state changes, instead of polling for it
+    future.add_done_callback(lambda f: print("Done callback - Future state changed to done"))
+    
     # Set result after a delay
     asyncio.create_task(async_operation(future, "monitored_result", 1))
     
-    # Monitor the future state
-    while not future.done():
-        print("Future still pending...")
-        await asyncio.sleep(0.3)
+    print("Future still pending...")
+    await future  # Wakes up exactly once, when the result is set
     
     print(f"Future done: {future.done()}")
     print(f"Result: {future.result()}")
@@ -258,7 +290,7 @@ async def manual_future_control():
     """
     print("\n=== Manual Future Control ===")
     
-    future = asyncio.Future()
+    future = asyncio.get_running_loop().create_future()
     
     # Randomly decide success or failure
     if random.choice([True, False]):
@@ -276,6 +308,12 @@ async def manual_future_control():
 
 async def main():
     """Main function running all examples"""
+    # Tasks that finish before their first real suspension complete
+    # immediately, without a round trip through the event loop. uvloop 0.23
+    # can't create eager tasks, so this is only done on the stock loop.
+    if uvloop is None:
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+    
     await basic_future_example()
     
     print("\nPress Enter to continue to the next example...")
@@ -312,4 +350,6 @@ async def main():
     print("• Understanding Futures helps with advanced asyncio usage")
 
 if __name__ == "__main__":
-    asyncio.run(main()) 
\ No newline at end of file
+    # Use uvloop's C event loop when available, the stock asyncio loop otherwise
+    loop_factory = uvloop.new_event_loop if uvloop else None
+    asyncio.run(main(), loop_factory=loop_factory) 
\ No newline at end of file
@@ -9,14 +9,14 @@ TUTORIAL EXPLANATION:
 FastAPI Background Tasks - Simple Non-blocking Execution
 
 This simplified example demonstrates FastAPI's background tasks feature with
-basic synchronous operations. The key concept is that HTTP responses return
+basic asynchronous operations. The key concept is that HTTP responses return
 immediately while background jobs run after the response is sent.
 
 KEY CONCEPTS DEMONSTRATED:
 - FastAPI BackgroundTasks: Non-blocking task execution
 - Response-first pattern: Return HTTP response immediately  
 - Multiple background jobs from single endpoint
-- Synchronous operations in background (time.sleep)
+- Async operations in background (asyncio.sleep) that don't tie up threads
 - Simple logging to show task execution timing
 
 THE POWER OF BACKGROUND TASKS:
@@ -40,36 +40,117 @@ PERFORMANCE BENEFIT:
 - API stays responsive under load
 """
 
+import asyncio
 import logging
 import os
 import time
-from datetime import datetime
+import uuid
 from fastapi import FastAPI, BackgroundTasks, UploadFile
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
+_log_info = logger.info
 
 # FastAPI app instance
 app = FastAPI(title="Simple Background Tasks Tutorial", version="1.0.0")
 
-# Background task functions (using synchronous time.sleep)
-async def save_files_task(file_data_list: list[tuple[str, bytes]], folder: str) -> None:
+# Uploads are copied to disk in chunks of this size (1 MiB)
+UPLOAD_CHUNK_SIZE = 1 << 20
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string, formatted in C by strftime()"""
+    return time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+
+def remove_staged_file(staged_path: str) -> None:
+    """Delete a staged upload that will never be moved into place"""
+    try:
+        os.unlink(staged_path)
+    except FileNotFoundError:
+        pass
+
+# Background task functions
+def move_staged_file(staged_path: str, file_path: str) -> None:
     """
-    Background task to save files to disk
+    Move one staged upload to its final path (blocking, runs in a thread)
     
     Args:
-        file_data_list: List of tuples containing (filename, file_content)
+        staged_path: Temporary file written by stage_upload()
+        file_path: Final location of the file
+    """
+    # A rename within the same folder - no file data is copied
+    try:
+        os.replace(staged_path, file_path)
+    except OSError:
+        remove_staged_file(staged_path)
+        raise
+
+async def save_files_task(staged_files: list[tuple[str, str]], folder: str) -> None:
+    """
+    Background task to move staged uploads into place
+    
+    Each blocking file operation runs in the default thread pool, and all
+    of them run concurrently, so the event loop is never blocked on disk.
+    One log line is written for the whole batch rather than one per file.
+    
+    Args:
+        staged_files: List of tuples containing (staged_path, filename)
         folder: Target folder to save files
     """
-    os.makedirs(folder, exist_ok=True)
+    results = await asyncio.gather(*(
+        asyncio.to_thread(move_staged_file, staged_path, os.path.join(folder, filename))
+        for staged_path, filename in staged_files
+    ), return_exceptions=True)
+    
+    # One failed move must not stop the others from being reported
+    failed = 0
+    for (_, filename), result in zip(staged_files, results):
+        if isinstance(result, Exception):
+            failed += 1
+            logger.error("❌ File %s could not be saved: %s", filename, result)
+    
+    # %-style arguments are only formatted if INFO logging is enabled
+    _log_info("✅ %d files have been written to '%s'.", len(staged_files) - failed, folder)
+
+def write_chunk(fd: int, chunk: bytes) -> None:
+    """
+    Write a whole chunk to a raw file descriptor (blocking, runs in a thread)
+    
+    Args:
+        fd: Descriptor returned by os.open()
+        chunk: Bytes to write
+    """
+    view = memoryview(chunk)
+    while view:
+        written = os.write(fd, view)
+        view = view[written:]
 
-    for filename, file_content in file_data_list:
-        file_path = os.path.join(folder, filename)
-        
-        with open(file_path, "wb") as f:
-            f.write(file_content)
-            logger.info(f"✅ File {file_path} has been written.")
+async def stage_upload(file: UploadFile, folder: str) -> str:
+    """
+    Stream an upload into a temporary file in `folder`
+    
+    The file is copied chunk by chunk, so only one chunk is ever held in
+    memory no matter how large the upload is. Chunks go straight to a raw
+    descriptor with os.write(), skipping the buffered file object that
+    open() would set up, flush and tear down.
+    
+    Returns:
+        Path of the temporary file
+    """
+    staged_path = os.path.join(folder, f".{uuid.uuid4().hex}.part")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(staged_path, flags, 0o644)
+    try:
+        try:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                await asyncio.to_thread(write_chunk, fd, chunk)
+        finally:
+            os.close(fd)
+    except BaseException:
+        # Includes cancellation, e.g. when the client disconnects
+        remove_staged_file(staged_path)
+        raise
+    return staged_path
 
 
 @app.post("/upload")
@@ -78,21 +159,39 @@ async def post_upload_files(files: list[UploadFile], background_tasks: Backgroun
     Upload multiple files with background processing
     
     This endpoint demonstrates:
-    1. Reading file content immediately in the request handler
-    2. Passing file content (not file objects) to background task
-    3. Immediate response while file writing happens in background
+    1. Streaming each upload to a temporary file in the request handler
+    2. Passing file paths (not file objects or contents) to background task
+    3. Immediate response while files are moved into place in background
     """
-    # Read all file contents immediately (before background task)
-    file_data_list = []
-    for file in files:
-        content = await file.read()
-        file_data_list.append((file.filename, content))
+    folder = "data"
+    os.makedirs(folder, exist_ok=True)
+    
+    # Stream uploads to disk now: file objects are closed once the response
+    # is sent, and holding whole bodies in memory doesn't scale.
+    # All uploads are staged concurrently; gather() keeps them in order.
+    staged_paths = await asyncio.gather(
+        *(stage_upload(file, folder) for file in files),
+        return_exceptions=True,
+    )
+    errors = [result for result in staged_paths if isinstance(result, BaseException)]
+    if errors:
+        # No background task will run, so nothing would ever move or
+        # delete the uploads that were staged successfully
+        for result in staged_paths:
+            if not isinstance(result, BaseException):
+                remove_staged_file(result)
+        raise errors[0]
+    
+    staged_files = [
+        (staged_path, os.path.basename(file.filename))
+        for staged_path, file in zip(staged_paths, files)
+    ]
     
-    # Add background task with file content (not file objects)
+    # Add background task with file paths (not file objects)
     background_tasks.add_task(
         save_files_task,
-        file_data_list,
-        "data"
+        staged_files,
+        folder
     )
 
     logger.info(f"📤 Returning immediate response for {len(files)} files")
@@ -100,33 +199,37 @@ async def post_upload_files(files: list[UploadFile], background_tasks: Backgroun
         "message": f"{len(files)} files are being processed and saved in background",
         "files": [file.filename for file in files],
         "note": "Files are being written to 'data' folder in background",
-        "current_time": datetime.now().isoformat()
+        "current_time": utc_timestamp()
     }
 
-def background_job_short():
+async def background_job_short():
     """
     Background job that takes 3 seconds
     
     This demonstrates:
-    1. Synchronous operation in background
-    2. Simple timing with time.sleep()
+    1. Asynchronous operation in background
+    2. Simple timing with asyncio.sleep()
     3. Logging when job completes
+    
+    Being async, the job runs on the event loop. A plain def job would
+    occupy a worker thread from Starlette's limited pool while it waits;
+    for real blocking work, call it with await asyncio.to_thread(...).
     """
     logger.info("🟡 Short job started (3 seconds)")
-    time.sleep(3)  # Simulate 3 seconds of work
+    await asyncio.sleep(3)  # Simulate 3 seconds of work
     logger.info("🟢 Short job completed after 3 seconds!")
 
-def background_job_long():
+async def background_job_long():
     """
     Background job that takes 6 seconds
     
     This demonstrates:
-    1. Longer synchronous operation
+    1. Longer asynchronous operation
     2. Multiple jobs can run simultaneously 
     3. Jobs complete independently
     """
     logger.info("🟡 Long job started (6 seconds)")
-    time.sleep(6)  # Simulate 6 seconds of work
+    await asyncio.sleep(6)  # Simulate 6 seconds of work
     logger.info("🟢 Long job completed after 6 seconds!")
 
 # Single API endpoint
@@ -142,7 +245,7 @@ def start_background_jobs(background_tasks: BackgroundTasks):
     3. Jobs start after HTTP response is sent
     4. Simple, clean background task pattern
     """
-    start_time = datetime.now()
+    start_time = utc_timestamp()
     
     # Add both background tasks
     background_tasks.add_task(background_job_short)
@@ -155,7 +258,7 @@ def start_background_jobs(background_tasks: BackgroundTasks):
         "message": "Two background jobs started!",
         "job_1": "Will complete in 3 seconds",
         "job_2": "Will complete in 6 seconds", 
-        "started_at": start_time.isoformat(),
+        "started_at": start_time,
         "note": "Check server logs to see job completion"
     }
 
@@ -197,5 +300,6 @@ if __name__ == "__main__":
     
     demo_explanation()
     
-    # Run the FastAPI server
-    uvicorn.run(app, host="127.0.0.1", port=8910) 
\ No newline at end of file
+    # Run the FastAPI server. loop="auto" picks uvloop when it is installed
+    # (pip install uvloop) and falls back to the asyncio loop otherwise
+    uvicorn.run(app, host="127.0.0.1", port=8910, loop="auto") 
\ No newline at end of file